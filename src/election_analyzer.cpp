@@ -3,6 +3,7 @@
 #include <numeric>
 #include <iomanip>
 #include <cmath>
+#include <sstream>
 
 Define_Module(ElectionAnalyzer);
 
@@ -13,6 +14,9 @@ ElectionAnalyzer::ElectionAnalyzer()
     currentRounds = 0;
     currentMessages = 0;
     leaderElected = false;
+    avgRounds = 0;
+    avgMessages = 0;
+    avgTime = 0;
 }
 
 ElectionAnalyzer::~ElectionAnalyzer()
@@ -83,17 +87,20 @@ void ElectionAnalyzer::collectStatistics()
 {
     if (roundsPerRun.empty()) return;
     
-    // Calculate averages
-    double avgRounds = std::accumulate(roundsPerRun.begin(), roundsPerRun.end(), 0.0) / roundsPerRun.size();
-    double avgMessages = std::accumulate(messagesPerRun.begin(), messagesPerRun.end(), 0.0) / messagesPerRun.size();
-    double avgTime = std::accumulate(timeToElection.begin(), timeToElection.end(), 0.0) / timeToElection.size();
+    // Calculate averages (reused by printSummary and writeAnalysisReport)
+    avgRounds = std::accumulate(roundsPerRun.begin(), roundsPerRun.end(), 0.0) / roundsPerRun.size();
+    avgMessages = std::accumulate(messagesPerRun.begin(), messagesPerRun.end(), 0.0) / messagesPerRun.size();
+    avgTime = std::accumulate(timeToElection.begin(), timeToElection.end(), 0.0) / timeToElection.size();
     
     // Calculate standard deviations
     double sqSumRounds = 0, sqSumMessages = 0, sqSumTime = 0;
     for (size_t i = 0; i < roundsPerRun.size(); i++) {
-        sqSumRounds += pow(roundsPerRun[i] - avgRounds, 2);
-        sqSumMessages += pow(messagesPerRun[i] - avgMessages, 2);
-        sqSumTime += pow(timeToElection[i] - avgTime, 2);
+        double dRounds = roundsPerRun[i] - avgRounds;
+        double dMessages = messagesPerRun[i] - avgMessages;
+        double dTime = timeToElection[i] - avgTime;
+        sqSumRounds += dRounds * dRounds;
+        sqSumMessages += dMessages * dMessages;
+        sqSumTime += dTime * dTime;
     }
     double stdRounds = sqrt(sqSumRounds / roundsPerRun.size());
     double stdMessages = sqrt(sqSumMessages / messagesPerRun.size());
@@ -125,27 +132,27 @@ void ElectionAnalyzer::printSummary()
         return;
     }
     
-    double avgRounds = std::accumulate(roundsPerRun.begin(), roundsPerRun.end(), 0.0) / roundsPerRun.size();
-    double avgMessages = std::accumulate(messagesPerRun.begin(), messagesPerRun.end(), 0.0) / messagesPerRun.size();
-    
-    EV_INFO << "\n"
-            << "╔═══════════════════════════════════════════════════════════╗\n"
-            << "║              ELECTION ANALYSIS SUMMARY                     ║\n"
-            << "╠═══════════════════════════════════════════════════════════╣\n"
-            << "║  Total Runs: " << std::setw(5) << totalRuns << "                                       ║\n"
-            << "║  Avg Rounds: " << std::fixed << std::setprecision(2) << std::setw(8) << avgRounds << "                                  ║\n"
-            << "║  Avg Messages: " << std::setw(8) << avgMessages << "                                ║\n"
-            << "╠═══════════════════════════════════════════════════════════╣\n"
-            << "║  LEADER DISTRIBUTION:                                      ║\n";
+    // Build the whole box first so it is logged as a single entry
+    std::ostringstream out;
+    out << "\n"
+        << "╔═══════════════════════════════════════════════════════════╗\n"
+        << "║              ELECTION ANALYSIS SUMMARY                     ║\n"
+        << "╠═══════════════════════════════════════════════════════════╣\n"
+        << "║  Total Runs: " << std::setw(5) << totalRuns << "                                       ║\n"
+        << "║  Avg Rounds: " << std::fixed << std::setprecision(2) << std::setw(8) << avgRounds << "                                  ║\n"
+        << "║  Avg Messages: " << std::setw(8) << avgMessages << "                                ║\n"
+        << "╠═══════════════════════════════════════════════════════════╣\n"
+        << "║  LEADER DISTRIBUTION:                                      ║\n";
     
     for (const auto& pair : leaderCounts) {
         double percentage = (double)pair.second / totalRuns * 100;
-        EV_INFO << "║    Node " << std::setw(3) << pair.first << ": " 
-                << std::setw(4) << pair.second << " times (" 
-                << std::fixed << std::setprecision(1) << std::setw(5) << percentage << "%)                  ║\n";
+        out << "║    Node " << std::setw(3) << pair.first << ": " 
+            << std::setw(4) << pair.second << " times (" 
+            << std::fixed << std::setprecision(1) << std::setw(5) << percentage << "%)                  ║\n";
     }
     
-    EV_INFO << "╚═══════════════════════════════════════════════════════════╝\n\n";
+    out << "╚═══════════════════════════════════════════════════════════╝\n\n";
+    EV_INFO << out.str();
 }
 
 void ElectionAnalyzer::writeAnalysisReport()
@@ -160,10 +167,6 @@ void ElectionAnalyzer::writeAnalysisReport()
     file << "Total Runs: " << totalRuns << "\n\n";
     
     if (!roundsPerRun.empty()) {
-        double avgRounds = std::accumulate(roundsPerRun.begin(), roundsPerRun.end(), 0.0) / roundsPerRun.size();
-        double avgMessages = std::accumulate(messagesPerRun.begin(), messagesPerRun.end(), 0.0) / messagesPerRun.size();
-        double avgTime = std::accumulate(timeToElection.begin(), timeToElection.end(), 0.0) / timeToElection.size();
-        
         file << "Performance Metrics:\n";
         file << "  Average Rounds to Election: " << std::fixed << std::setprecision(2) << avgRounds << "\n";
         file << "  Average Messages: " << avgMessages << "\n";
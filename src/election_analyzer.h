@@ -27,6 +27,11 @@ private:
     std::vector<int> messagesPerRun;      // Total messages per run
     std::vector<double> timeToElection;   // Simulation time to elect leader
     
+    // Aggregates computed once by collectStatistics()
+    double avgRounds;
+    double avgMessages;
+    double avgTime;
+    
     // Current run tracking
     int currentLeader;
     int currentRounds;